@@ -89,23 +89,24 @@ def openstack_properties():
         os_properties['os_version'] = \
             os_version_ini.get('default',
                                'DISTRIB_RELEASE').replace('"', '').lstrip('r')
-        os_properties['os_version_major'] = \
-            int(semantic_regex.match(os_properties['os_version']).group(1))
-        os_properties['os_version_minor'] = \
-            int(semantic_regex.match(os_properties['os_version']).group(2))
-        os_properties['os_version_patch'] = \
-            int(semantic_regex.match(os_properties['os_version']).group(3))
+        os_version_match = semantic_regex.match(os_properties['os_version'])
+        os_properties['os_version_major'] = int(os_version_match.group(1))
+        os_properties['os_version_minor'] = int(os_version_match.group(2))
+        os_properties['os_version_patch'] = int(os_version_match.group(3))
     except (IOError, OSError, NoOptionError, NoSectionError, AttributeError):
         warn(UserWarning("Failed to parse OpenStack version file!"))
 
     return os_properties
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def os_api_conn():
     """Provide an authorized API connection to the 'default' cloud on the
     OpenStack infrastructure.
 
+    Note: the connection is shared for the whole test session so that the
+    Keystone authentication and service catalog discovery only happen once.
+
     Returns:
         openstack.connection.Connection: https://bit.ly/2LqgiiT
     """
@@ -288,11 +289,13 @@ def create_server(os_api_conn, openstack_properties):
     yield _factory
 
     # Teardown
-    for server in servers:
+    def _delete_server(server):
         if not os_api_conn.delete_server(name_or_id=server.id, wait=True):
             warn(UserWarning("Attempted to delete non-existent server!"
                              " ID: {}".format(server.id)))
 
+    helpers.parallel_map(_delete_server, servers)
+
 
 @pytest.fixture
 def create_volume(os_api_conn, openstack_properties):
@@ -374,8 +377,11 @@ def create_volume(os_api_conn, openstack_properties):
     yield _factory
 
     # Teardown
-    for volume in volumes:
-        os_api_conn.delete_volume(name_or_id=volume.id, wait=True)
+    helpers.parallel_map(
+        lambda volume: os_api_conn.delete_volume(name_or_id=volume.id,
+                                                 wait=True),
+        volumes
+    )
 
 
 @pytest.fixture
@@ -443,8 +449,9 @@ def ssh_connect(openstack_properties):
                     ),
                     auth_timeout=auth_timeout
                 )
+                break
             except NoValidConnectionsError:
-                if attempt != retries + 1:
+                if attempt < retries:
                     sleep(attempt)
                 else:
                     raise   # Re-raise
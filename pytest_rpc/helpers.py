@@ -9,8 +9,34 @@ from warnings import warn
 from pprint import pformat
 from platform import system
 from subprocess import call
+from multiprocessing.pool import ThreadPool
 from packaging.version import Version, InvalidVersion
 
+# Shakes tiny fist at Python 2.7!
+try:
+    # noinspection PyCompatibility
+    from shlex import quote
+except ImportError:
+    # noinspection PyCompatibility
+    from pipes import quote
+
+
+# ==============================================================================
+# Globals
+# ==============================================================================
+# Container names resolved per (host, container type) for the test session.
+container_names = {}
+
+# Ping command count option as function of OS
+ping_count_option = '-n' if system().lower() == 'windows' else '-c'
+
+# Matches the block delimiter lines of 'swift-recon' output.
+swift_recon_delimiter_regex = re.compile(r'^={79}')
+
+# Matches the ring summary line of 'swift-ring-builder' output.
+swift_ring_summary_regex = re.compile(r'partitions.*dispersion|'
+                                      r'dispersion.*partitions')
+
 
 # ==============================================================================
 # Helpers
@@ -56,10 +82,20 @@ def expect_os_property(os_api_conn,
         RuntimeError: The property was not found on the given object.
     """
 
+    # Prefer direct ID lookups over name-or-ID searches which list every object.
     try:
-        get_service_method = getattr(os_api_conn, "get_{}".format(os_service))
+        get_service_method = getattr(os_api_conn,
+                                     "get_{}_by_id".format(os_service))
     except AttributeError:
-        raise RuntimeError("Invalid '{}' service specified!".format(os_service))
+        try:
+            get_service_method = getattr(os_api_conn,
+                                         "get_{}".format(os_service))
+        except AttributeError:
+            raise RuntimeError(
+                "Invalid '{}' service specified!".format(os_service)
+            )
+
+    expected_value_lower = expected_value.lower()
 
     for attempt in range(1, retries + 1):
         result = get_service_method(os_object.id)
@@ -79,7 +115,7 @@ def expect_os_property(os_api_conn,
 
         if actual_value == expected_value:
             return True
-        elif actual_value.lower() == expected_value and case_insensitive:
+        elif case_insensitive and actual_value.lower() == expected_value_lower:
             return True
         else:
             if show_warnings:
@@ -98,7 +134,8 @@ def expect_os_property(os_api_conn,
                 )
                 warn(UserWarning(warning_message))
 
-        sleep(attempt)
+        if attempt < retries:
+            sleep(attempt)
 
     return False
 
@@ -118,18 +155,16 @@ def ping_from_mnaio(host_or_ip, retries=10):
         bool: True if host was successfully pinged otherwise False.
     """
 
-    # Ping command count option as function of OS
-    param = '-n' if system().lower() == 'windows' else '-c'
-
     # Building the command. Ex: "ping_from_mnaio -c 1 google.com"
-    command = ['ping', param, '1', host_or_ip]
+    command = ['ping', ping_count_option, '1', host_or_ip]
 
     # Pinging
     for attempt in range(1, retries + 1):
         if call(command) == 0:
             return True
 
-        sleep(attempt)
+        if attempt < retries:
+            sleep(attempt)
 
     return False
 
@@ -144,11 +179,66 @@ def generate_random_string(string_length=10):
         str: Random string of specified length (maximum of 32 characters)
     """
 
-    random_str = str(uuid.uuid4())
-    random_str = random_str.upper()
-    random_str = random_str.replace("-", "")
+    # The 'hex' form of a UUID is 32 characters without any dashes.
+    return uuid.uuid4().hex[:string_length].upper()
+
+
+def parallel_map(func, items, max_workers=16):
+    """Apply a function to every item concurrently using a pool of threads.
+
+    Note: this is intended for I/O bound work like waiting on OpenStack API
+    calls where most of the time is spent blocked on the network.
+
+    Args:
+        func (def): The function to apply to each item.
+        items (iterable): The items to process.
+        max_workers (int): The maximum number of threads to use.
+
+    Returns:
+        list: The results of each function call in the same order as the given
+            items.
+    """
+
+    items = list(items)
+
+    if not items:
+        return []
+
+    pool = ThreadPool(min(max_workers, len(items)))
+    try:
+        return pool.map(func, items)
+    finally:
+        pool.close()
+        pool.join()
+
 
-    return random_str[0:string_length]  # Return the random_str string.
+def get_container_name(container_type, run_on_host):
+    """Get the name of the first container of the given type on a host.
+
+    Note: successful lookups are cached for the rest of the test session so
+    that 'lxc-ls' is only executed once per host and container type.
+
+    Args:
+        container_type (str): The container type to look up. (e.g. 'utility')
+        run_on_host (testinfra.Host): Testinfra host object to execute the
+                                      lookup command on.
+
+    Returns:
+        str: The container name or an empty string if no container was found.
+    """
+
+    key = (run_on_host, container_type)
+
+    if key not in container_names:
+        cmd = "lxc-ls -1 | grep {} | head -n 1".format(container_type)
+        name = run_on_host.run(cmd).stdout.strip()
+
+        if not name:
+            return name
+
+        container_names[key] = name
+
+    return container_names[key]
 
 
 def run_on_container(command, container_type, run_on_host):
@@ -164,10 +254,9 @@ def run_on_container(command, container_type, run_on_host):
         testinfra.CommandResult: Result of command execution.
     """
 
-    pre_command = ("lxc-attach "
-                   "-n $(lxc-ls -1 | grep {} | head -n 1) "
-                   "-- bash -c".format(container_type))
-    cmd = "{} '{}'".format(pre_command, command)
+    container_name = get_container_name(container_type, run_on_host)
+    pre_command = "lxc-attach -n {} -- bash -c".format(container_name)
+    cmd = "{} {}".format(pre_command, quote(command))
     return run_on_host.run(cmd)
 
 
@@ -210,18 +299,20 @@ def parse_swift_recon(recon_out):
     ============================================================================
     """
 
-    lines = recon_out.splitlines()
-    delimiter_regex = re.compile(r'^={79}')
     collection = []
+    block = []
+    delimiter_seen = False
+
+    # Content after the last delimiter is not part of a block.
+    for line in recon_out.splitlines():
+        if swift_recon_delimiter_regex.match(line):
+            if delimiter_seen:
+                collection.append(block)
+                block = []
+            delimiter_seen = True
+        elif delimiter_seen:
+            block.append(line)
 
-    delimiter_positions = [ind for ind, x in enumerate(lines)
-                           if delimiter_regex.match(x)]
-
-    for ind, delimiter_position in enumerate(delimiter_positions):
-        if ind != len(delimiter_positions) - 1:  # Are in the last position?
-            start = delimiter_position + 1
-            end = delimiter_positions[ind + 1]
-            collection.append(lines[start:end])
     return collection
 
 
@@ -244,10 +335,11 @@ def parse_swift_ring_builder(ring_builder_output):
     """
 
     swift_data = {}
-    swift_lines = ring_builder_output.split('\n')
-    matching = [s for s in swift_lines if "partitions" and "dispersion" in s]
+    swift_lines = ring_builder_output.splitlines()
+    matching = next((s for s in swift_lines
+                     if swift_ring_summary_regex.search(s)), None)
     if matching:
-        elements = [s.strip() for s in matching[0].split(',')]
+        elements = [s.strip() for s in matching.split(',')]
         for element in elements:
             v, k = element.split(' ')
             swift_data[k] = float(v)
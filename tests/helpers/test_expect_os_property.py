@@ -12,10 +12,10 @@ from pytest_rpc.helpers import expect_os_property
 # ==============================================================================
 # Fixtures
 # ==============================================================================
-@pytest.fixture
+@pytest.fixture(scope='module')
 def fake_os_object():
     """An object that works like a munch.Munch object containing just an ID
-    property.
+    property. (Immutable, so it is shared by every test in this module)
 
     Returns:
         namedtuple: An object that responds to an attribute lookup.
@@ -50,7 +50,7 @@ def test_expect_success(mocker, fake_os_object):
     # Mock
     mocker.patch.object(openstack.connection, 'Connection', autospec=True)
     mock_os_api_conn = openstack.connection.Connection()
-    mock_os_api_conn.get_server.return_value = prop_dict
+    mock_os_api_conn.get_server_by_id.return_value = prop_dict
 
     # Test
     assert expect_os_property(os_api_conn=mock_os_api_conn,
@@ -81,7 +81,7 @@ def test_expect_failure(mocker, fake_os_object):
     # Mock
     mocker.patch.object(openstack.connection, 'Connection', autospec=True)
     mock_os_api_conn = openstack.connection.Connection()
-    mock_os_api_conn.get_server.return_value = prop_dict
+    mock_os_api_conn.get_server_by_id.return_value = prop_dict
 
     # Test
     assert not expect_os_property(os_api_conn=mock_os_api_conn,
@@ -113,7 +113,7 @@ def test_only_extended_props(mocker, fake_os_object):
     # Mock
     mocker.patch.object(openstack.connection, 'Connection', autospec=True)
     mock_os_api_conn = openstack.connection.Connection()
-    mock_os_api_conn.get_server.return_value = prop_dict
+    mock_os_api_conn.get_server_by_id.return_value = prop_dict
 
     # Test
     assert expect_os_property(os_api_conn=mock_os_api_conn,
@@ -144,7 +144,7 @@ def test_case_insensitive_match(mocker, fake_os_object):
     # Mock
     mocker.patch.object(openstack.connection, 'Connection', autospec=True)
     mock_os_api_conn = openstack.connection.Connection()
-    mock_os_api_conn.get_server.return_value = prop_dict
+    mock_os_api_conn.get_server_by_id.return_value = prop_dict
 
     # Test
     assert expect_os_property(os_api_conn=mock_os_api_conn,
@@ -154,6 +154,38 @@ def test_case_insensitive_match(mocker, fake_os_object):
                               expected_value=prop_value_exp)
 
 
+def test_case_insensitive_match_upper_expected(mocker, fake_os_object):
+    """Verify that the helper matches an upper case expected value against a
+    lower case actual value.
+
+    Args:
+        mocker (MockFixture): A wrapper to the Mock library.
+        fake_os_object (namedtuple): An object that responds to an attribute
+            lookup. ('id')
+    """
+
+    # Expect
+    prop_name_exp = 'prop'
+    prop_value_exp = 'VALUE'
+
+    # Setup
+    service_name = 'server'
+    prop_dict = {prop_name_exp: prop_value_exp.lower()}
+
+    # Mock
+    mocker.patch.object(openstack.connection, 'Connection', autospec=True)
+    mock_os_api_conn = openstack.connection.Connection()
+    mock_os_api_conn.get_server_by_id.return_value = prop_dict
+
+    # Test
+    assert expect_os_property(os_api_conn=mock_os_api_conn,
+                              os_service=service_name,
+                              os_object=fake_os_object,
+                              os_prop_name=prop_name_exp,
+                              expected_value=prop_value_exp,
+                              retries=1)
+
+
 def test_case_sensitive_mismatch(mocker, fake_os_object):
     """Verify that the helper respects matching only with case sensitivity when
     specified by the caller.
@@ -175,7 +207,7 @@ def test_case_sensitive_mismatch(mocker, fake_os_object):
     # Mock
     mocker.patch.object(openstack.connection, 'Connection', autospec=True)
     mock_os_api_conn = openstack.connection.Connection()
-    mock_os_api_conn.get_server.return_value = prop_dict
+    mock_os_api_conn.get_server_by_id.return_value = prop_dict
 
     # Test
     assert not expect_os_property(os_api_conn=mock_os_api_conn,
@@ -215,3 +247,35 @@ def test_invalid_service_name(mocker, fake_os_object):
                            os_object=fake_os_object,
                            os_prop_name=prop_name_exp,
                            expected_value=prop_value_exp)
+
+
+def test_fallback_to_search(mocker, fake_os_object):
+    """Verify that the helper falls back to the generic 'get' method for
+    services that do not support direct ID lookups.
+
+    Args:
+        mocker (MockFixture): A wrapper to the Mock library.
+        fake_os_object (namedtuple): An object that responds to an attribute
+            lookup. ('id')
+    """
+
+    # Expect
+    prop_name_exp = 'prop'
+    prop_value_exp = 'value'
+
+    # Setup
+    service_name = 'keypair'
+    prop_dict = {prop_name_exp: prop_value_exp}
+
+    # Mock
+    mocker.patch.object(openstack.connection, 'Connection', autospec=True)
+    mock_os_api_conn = openstack.connection.Connection()
+    mock_os_api_conn.get_keypair.return_value = prop_dict
+
+    # Test
+    assert expect_os_property(os_api_conn=mock_os_api_conn,
+                              os_service=service_name,
+                              os_object=fake_os_object,
+                              os_prop_name=prop_name_exp,
+                              expected_value=prop_value_exp)
+    mock_os_api_conn.get_keypair.assert_called_with(fake_os_object.id)
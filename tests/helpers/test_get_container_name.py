@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+import pytest_rpc.helpers
+import testinfra.backend.base
+import testinfra.host
+
+"""Test cases for the 'get_container_name' helper function."""
+
+
+def test_lookup_cached(mocker):
+    """Verify get_container_name only queries the host once for a given
+    container type and returns the stripped container name.
+
+    relies on mocked objects from testinfra
+    """
+
+    fake_backend = mocker.Mock(spec=testinfra.backend.base.BaseBackend)
+    myhost = testinfra.host.Host(fake_backend)
+    cr = mocker.Mock(spec=testinfra.backend.base.CommandResult)
+
+    cr.rc = 0
+    cr.stdout = 'host1_utility_container-1a2b3c4d\n'
+    mocker.patch('testinfra.host.Host.run', return_value=cr)
+
+    for _ in range(3):
+        assert pytest_rpc.helpers.get_container_name('utility', myhost) == \
+            'host1_utility_container-1a2b3c4d'
+
+    # noinspection PyUnresolvedReferences
+    myhost.run.assert_called_once_with(
+        'lxc-ls -1 | grep utility | head -n 1'
+    )
+
+
+def test_missing_container_not_cached(mocker):
+    """Verify get_container_name returns an empty string and does not cache the
+    result when no container of the given type exists.
+
+    relies on mocked objects from testinfra
+    """
+
+    fake_backend = mocker.Mock(spec=testinfra.backend.base.BaseBackend)
+    myhost = testinfra.host.Host(fake_backend)
+    cr = mocker.Mock(spec=testinfra.backend.base.CommandResult)
+
+    cr.rc = 0
+    cr.stdout = ''
+    mocker.patch('testinfra.host.Host.run', return_value=cr)
+
+    assert pytest_rpc.helpers.get_container_name('cinder', myhost) == ''
+    assert pytest_rpc.helpers.get_container_name('cinder', myhost) == ''
+
+    # noinspection PyUnresolvedReferences
+    assert myhost.run.call_count == 2
@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+"""Test cases for the 'parallel_map' helper function."""
+# ==============================================================================
+# Imports
+# ==============================================================================
+import pytest
+import pytest_rpc.helpers
+
+
+# ==============================================================================
+# Tests
+# ==============================================================================
+def test_empty():
+    """Verify that the helper returns an empty list when given no items."""
+
+    assert pytest_rpc.helpers.parallel_map(lambda x: x, []) == []
+
+
+def test_preserves_order():
+    """Verify that the helper returns results in the same order as the given
+    items."""
+
+    items = range(50)
+
+    result = pytest_rpc.helpers.parallel_map(lambda x: x * 2, items, 4)
+
+    assert result == [x * 2 for x in items]
+
+
+def test_exception_raised():
+    """Verify that the helper re-raises exceptions from the given function."""
+
+    def _fail(item):
+        raise RuntimeError("Failed on item: {}".format(item))
+
+    with pytest.raises(RuntimeError):
+        pytest_rpc.helpers.parallel_map(_fail, [1, 2, 3])
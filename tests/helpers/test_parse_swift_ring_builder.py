@@ -54,6 +54,24 @@ Devices:    id  region  zone      ip address  port replication ip  replication p
     assert result['dispersion'] == 0.00
 
 
+def test_dispersion_without_partitions():
+    """Verify parse_swift_ring_builder ignores lines that mention dispersion
+    but are not the ring summary line."""
+
+    swift_ring_builder_out = """
+Note: dispersion is calculated across all regions and zones
+/etc/swift/account.builder, build version 5
+256 partitions, 3.000000 replicas, 1 regions, 1 zones, 9 devices, 0.78 balance, 0.00 dispersion
+"""  # noqa
+
+    result = \
+        pytest_rpc.helpers.parse_swift_ring_builder(swift_ring_builder_out)
+
+    assert result['partitions'] == 256
+    assert result['replicas'] == 3
+    assert result['balance'] == 0.78
+
+
 def test_garbage():
     """Verify parse_swift_ring_builder returns an empty dictionary when provided a
     garbage string to parse."""
@@ -35,3 +35,20 @@ def test_unsuccessful_ping(mocker):
 
     # Test
     assert pytest_rpc.helpers.ping_from_mnaio('fake_host', 1) is False
+
+
+def test_no_sleep_after_last_attempt(mocker):
+    """Verify that the helper only waits between attempts and not after the
+    final failed attempt.
+
+    Args:
+        mocker (MockFixture): A wrapper to the Mock library.
+    """
+
+    # Mock
+    mocker.patch('pytest_rpc.helpers.call', autospec=True, return_value=1)
+    mock_sleep = mocker.patch('pytest_rpc.helpers.sleep', autospec=True)
+
+    # Test
+    assert pytest_rpc.helpers.ping_from_mnaio('fake_host', 3) is False
+    assert mock_sleep.call_count == 2
@@ -17,15 +17,39 @@ def test_expected_constructed_run_command(mocker):
     fake_backend = mocker.Mock(spec=testinfra.backend.base.BaseBackend)
     myhost = testinfra.host.Host(fake_backend)
     command_result = mocker.Mock(spec=testinfra.backend.base.CommandResult)
+    command_result.stdout = 'host1_swift_container-1a2b3c4d\n'
     mocker.patch('testinfra.host.Host.run', return_value=command_result)
 
     cmd = 'ls -al'
     container_type = 'swift'
 
-    expected_run_cmd = ("lxc-attach -n $(lxc-ls -1 | grep {} | head -n 1) "
-                        "-- bash -c '{}'".format(container_type, cmd))
+    expected_run_cmd = ("lxc-attach -n host1_swift_container-1a2b3c4d "
+                        "-- bash -c '{}'".format(cmd))
 
     result = pytest_rpc.helpers.run_on_container(cmd, container_type, myhost)
     # noinspection PyUnresolvedReferences
     myhost.run.assert_called_with(expected_run_cmd)
     assert result == command_result
+
+
+def test_command_with_single_quotes(mocker):
+    """Verify run_on_container safely quotes commands that contain single
+    quotes.
+
+    relies on mocked objects from testinfra
+    """
+
+    fake_backend = mocker.Mock(spec=testinfra.backend.base.BaseBackend)
+    myhost = testinfra.host.Host(fake_backend)
+    command_result = mocker.Mock(spec=testinfra.backend.base.CommandResult)
+    command_result.stdout = 'host1_utility_container-1a2b3c4d\n'
+    mocker.patch('testinfra.host.Host.run', return_value=command_result)
+
+    cmd = "echo 'hello world'"
+
+    expected_run_cmd = ("lxc-attach -n host1_utility_container-1a2b3c4d "
+                        "-- bash -c 'echo '\"'\"'hello world'\"'\"''")
+
+    pytest_rpc.helpers.run_on_container(cmd, 'utility', myhost)
+    # noinspection PyUnresolvedReferences
+    myhost.run.assert_called_with(expected_run_cmd)
@@ -17,15 +17,14 @@ def test_expected_constructed_run_command(mocker):
     fake_backend = mocker.Mock(spec=testinfra.backend.base.BaseBackend)
     myhost = testinfra.host.Host(fake_backend)
     command_result = mocker.Mock(spec=testinfra.backend.base.CommandResult)
+    command_result.stdout = 'host1_swift_container-1a2b3c4d\n'
     mocker.patch('testinfra.host.Host.run', return_value=command_result)
 
     cmd = 'ls -al'
-    container_type = 'swift'
-
     wrapped_cmd = \
         ". ~/openrc ; . /openstack/venvs/swift-*/bin/activate ; ls -al"
-    expected_run_cmd = ("lxc-attach -n $(lxc-ls -1 | grep {} | head -n 1) "
-                        "-- bash -c '{}'".format(container_type, wrapped_cmd))
+    expected_run_cmd = ("lxc-attach -n host1_swift_container-1a2b3c4d "
+                        "-- bash -c '{}'".format(wrapped_cmd))
 
     result = pytest_rpc.helpers.run_on_swift(cmd, myhost)
     # noinspection PyUnresolvedReferences